@@ -1,8 +1,15 @@
+import os
 import sys
 import time
 import secrets
+import hashlib
 import string
-from typing import List, Tuple, Dict, Union
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple, Dict, Union
 from colorama import Fore, Style, init
 import re
 import math
@@ -10,6 +17,135 @@ import math
 # Initialize colorama for colored output
 init(autoreset=True)
 
+_STRENGTH_COLOR = {
+    "Weak": Fore.RED,
+    "Moderate": Fore.YELLOW,
+    "Strong": Fore.BLUE,
+    "Very Strong": Fore.GREEN,
+}
+_RESET = Style.RESET_ALL
+
+# Summary rows written to stdout per write call when checking a file
+_OUTPUT_BATCH_ROWS = 4096
+
+# Batches with fewer uncached passwords than this are evaluated in-process;
+# worker startup would dominate
+_PARALLEL_MIN_BATCH = 50000
+
+# ProcessPoolExecutor rejects more workers than this on Windows
+_MAX_WINDOWS_WORKERS = 61
+
+# Precompiled patterns used by the per-password checks
+_RE_REPEAT = re.compile(r'(.)\1{2,}')
+
+# Character category bits, combined into a single mask per password
+_CLASS_LOWER = 1
+_CLASS_UPPER = 2
+_CLASS_DIGIT = 4
+_CLASS_SPECIAL = 8
+
+_LOWER_CHARS = frozenset(string.ascii_lowercase)
+_UPPER_CHARS = frozenset(string.ascii_uppercase)
+_DIGIT_CHARS = frozenset(string.digits)
+# Anything outside this set, including every non-ASCII character, is special
+_ALNUM_CHARS = _LOWER_CHARS | _UPPER_CHARS | _DIGIT_CHARS
+
+def _classify_password(password: str) -> int:
+    """Return the category mask of a password using C-level set probes."""
+    mask = 0
+    if not _LOWER_CHARS.isdisjoint(password):
+        mask |= _CLASS_LOWER
+    if not _UPPER_CHARS.isdisjoint(password):
+        mask |= _CLASS_UPPER
+    if not _DIGIT_CHARS.isdisjoint(password):
+        mask |= _CLASS_DIGIT
+    if not _ALNUM_CHARS.issuperset(password):
+        mask |= _CLASS_SPECIAL
+    return mask
+
+def _read_lines(file) -> Iterable[bytes]:
+    """Yield the lines of a binary file, ending lines at \r, \n or \r\n like text mode."""
+    tail = b''
+    for block in iter(lambda: file.read(1 << 20), b''):
+        lines = (tail + block).splitlines()
+        # Carry an unterminated last line over to the next block
+        tail = lines.pop() if lines and not block.endswith((b'\n', b'\r')) else b''
+        yield from lines
+    if tail:
+        yield tail
+
+# Whitespace removed by str.strip() that is also ASCII, for stripping raw lines
+_ASCII_WHITESPACE = bytes(code for code in range(128) if chr(code).isspace())
+
+if sys.hash_info.width >= 64:
+    def _blacklist_digest(password: bytes) -> int:
+        """Return the signed 64-bit digest under which a blacklisted password is stored.
+
+        This is the interpreter's keyed bytes hash, so digests are only comparable
+        within the process that computed them.
+        """
+        return hash(password)
+else:
+    # hash() is only 32 bits wide here, too few bits for rockyou-sized lists
+    def _blacklist_digest(password: bytes) -> int:
+        """Return the signed 64-bit digest under which a blacklisted password is stored."""
+        return int.from_bytes(hashlib.blake2b(password, digest_size=8).digest(), 'big', signed=True)
+
+def _blacklist_contains(blacklist: array, digest: int) -> bool:
+    """Binary-search a sorted digest array for a digest."""
+    index = bisect_left(blacklist, digest)
+    return index < len(blacklist) and blacklist[index] == digest
+
+def _random_choices(pool: str, count: int) -> List[str]:
+    """Draw count characters uniformly from a pool of at most 256 characters."""
+    size = len(pool)
+    # Bytes at or above this bound would bias the modulo draw, so they are rejected
+    limit = 256 - 256 % size
+    choices = []
+    while len(choices) < count:
+        for byte in secrets.token_bytes(2 * (count - len(choices))):
+            if byte < limit:
+                choices.append(pool[byte % size])
+                if len(choices) == count:
+                    break
+    return choices
+
+def _needle_pattern(needles) -> "re.Pattern":
+    """Compile literal substrings into one trie-shaped pattern scanned in a single pass."""
+    trie = {}
+    for needle in needles:
+        node = trie
+        for char in needle:
+            node = node.setdefault(char, {})
+        # The empty key marks the end of a needle
+        node[""] = {}
+    # Without needles the pattern would match everywhere, so never match instead
+    return re.compile(_trie_pattern(trie) if trie else r'(?!)')
+
+def _trie_pattern(node: dict) -> str:
+    """Render a trie node as a regex whose needles share their common prefixes."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A needle ends here; longer needles sharing this prefix are tried first
+        pattern = "(?:" + pattern + ")?"
+    return pattern
+
+@dataclass
+class _PasswordContext:
+    """Values derived from a password once and shared by every check."""
+
+    lower: str
+    length: int
+    class_mask: int
+
+    @classmethod
+    def build(cls, password: str) -> "_PasswordContext":
+        """Derive the shared values for a password."""
+        return cls(password.lower(), len(password), _classify_password(password))
+
 class PasswordComplexityChecker:
     """Advanced Password Complexity Checker Tool"""
 
@@ -23,10 +159,21 @@ class PasswordComplexityChecker:
     COLOR_CYAN = Fore.CYAN
     COLOR_RED = Fore.RED
 
-    def __init__(self, min_length: int = 8, max_length: int = 128, blacklist: set = None):
+    def __init__(
+        self,
+        min_length: int = 8,
+        max_length: int = 128,
+        blacklist: Union[Iterable[str], array] = None,
+        cache_size: int = 100000,
+        history_size: int = 1000,
+    ):
         """Initialize the password checker with configurable parameters."""
+        # LRU of evaluation results, keyed by password; cleared whenever a setting
+        # that affects the results (length limits, word lists, blacklist) changes
+        self._eval_cache = OrderedDict()
         self.min_length = min_length
         self.max_length = max_length
+        self.cache_size = cache_size
         self.common_passwords = self._load_common_passwords()
         self.dictionary_words = self._load_dictionary_words()
         self.common_sequences = [
@@ -34,8 +181,99 @@ class PasswordComplexityChecker:
             "qwerty", "asdfgh", "zxcvbn", "password", "abcdef",
             "01234", "98765", "9876543210", "fedcba"
         ]
-        self.blacklist = blacklist if blacklist is not None else set()
-        self.checked_passwords = []
+        keyboard_rows = ["qwertyuiop", "asdfghjkl", "zxcvbn"]
+        self._keyboard_trigrams = frozenset(
+            row[i:i+3] for row in keyboard_rows for i in range(len(row) - 2)
+        )
+        self.blacklist = blacklist if blacklist is not None else array('q')
+        # Most recent (password, results) pairs; statistics come from the running totals below
+        self.checked_passwords = deque(maxlen=history_size)
+        self.checked_count = 0
+        self.score_total = 0
+        self.strength_counts = Counter()
+        # (result key, check) pairs run in order by evaluate_password; a failed
+        # required check rejects the password without running the scoring checks
+        self._required_checks = (
+            ("length", self.check_length),
+            ("blacklist", self.check_blacklist),
+        )
+        self._checks = (
+            ("categories", self.check_character_categories),
+            ("common_password", self.check_common_password),
+            ("sequences", self.check_sequences),
+            ("dictionary", self.check_dictionary_words),
+        )
+
+    @property
+    def min_length(self) -> int:
+        """Minimum accepted password length."""
+        return self._min_length
+
+    @min_length.setter
+    def min_length(self, value: int):
+        self._min_length = value
+        self._eval_cache.clear()
+
+    @property
+    def max_length(self) -> int:
+        """Maximum accepted password length."""
+        return self._max_length
+
+    @max_length.setter
+    def max_length(self, value: int):
+        self._max_length = value
+        self._eval_cache.clear()
+
+    @property
+    def blacklist(self) -> array:
+        """Sorted array of blacklisted password digests."""
+        return self._blacklist
+
+    @blacklist.setter
+    def blacklist(self, value: Union[Iterable[str], array]):
+        # Accept either the digest array from load_blacklist or plaintext passwords
+        if not (isinstance(value, array) and value.typecode == 'q'):
+            digests = array('q')
+            for password in value:
+                if not isinstance(password, str):
+                    raise TypeError(f"Blacklist entries must be str passwords, not {type(password).__name__}")
+                digests.append(_blacklist_digest(password.encode('utf-8', 'surrogatepass')))
+            value = array('q', sorted(digests))
+        self._blacklist = value
+        self._eval_cache.clear()
+
+    @property
+    def dictionary_words(self) -> Tuple[str, ...]:
+        """Dictionary words searched for inside passwords."""
+        return self._dictionary_words
+
+    @dictionary_words.setter
+    def dictionary_words(self, words: Iterable[str]):
+        # Stored as a tuple so in-place edits cannot bypass the compiled pattern
+        self._dictionary_words = tuple(words)
+        self._dictionary_pattern = _needle_pattern(word for word in self._dictionary_words if len(word) > 3)
+        self._eval_cache.clear()
+
+    @property
+    def common_sequences(self) -> Tuple[str, ...]:
+        """Common character sequences searched for inside passwords."""
+        return self._common_sequences
+
+    @common_sequences.setter
+    def common_sequences(self, sequences: Iterable[str]):
+        self._common_sequences = tuple(sequences)
+        self._sequence_pattern = _needle_pattern(self._common_sequences)
+        self._eval_cache.clear()
+
+    @property
+    def common_passwords(self) -> frozenset:
+        """Passwords rejected outright as too common."""
+        return self._common_passwords
+
+    @common_passwords.setter
+    def common_passwords(self, passwords: Iterable[str]):
+        self._common_passwords = frozenset(passwords)
+        self._eval_cache.clear()
 
     def _load_common_passwords(self) -> List[str]:
         """Load a small set of common passwords."""
@@ -51,9 +289,9 @@ class PasswordComplexityChecker:
             "system", "computer", "internet", "server", "network"
         ]
 
-    def check_length(self, password: str) -> Tuple[bool, str, int]:
+    def check_length(self, password: str, ctx: _PasswordContext = None) -> Tuple[bool, str, int]:
         """Check if password meets length requirements."""
-        length = len(password)
+        length = ctx.length if ctx else len(password)
         if length < self.min_length:
             return False, f"Password is too short (minimum {self.min_length} characters)", 0
         elif length > self.max_length:
@@ -62,12 +300,13 @@ class PasswordComplexityChecker:
             score = min(25, int(length / self.max_length * 25))
             return True, f"Password length ({length}) is adequate", score
 
-    def check_character_categories(self, password: str) -> Tuple[bool, str, int]:
+    def check_character_categories(self, password: str, ctx: _PasswordContext = None) -> Tuple[bool, str, int]:
         """Check if password contains characters from multiple categories."""
-        has_lowercase = bool(re.search(r'[a-z]', password))
-        has_uppercase = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_special = bool(re.search(r'[^a-zA-Z0-9]', password))
+        class_mask = ctx.class_mask if ctx else _classify_password(password)
+        has_lowercase = bool(class_mask & _CLASS_LOWER)
+        has_uppercase = bool(class_mask & _CLASS_UPPER)
+        has_digit = bool(class_mask & _CLASS_DIGIT)
+        has_special = bool(class_mask & _CLASS_SPECIAL)
 
         categories_present = sum([has_lowercase, has_uppercase, has_digit, has_special])
         if categories_present < 3:
@@ -83,85 +322,93 @@ class PasswordComplexityChecker:
         category_str = ", ".join(category_details)
         return True, f"Password uses {categories_present} categories: {category_str}", score
 
-    def check_common_password(self, password: str) -> Tuple[bool, str, int]:
+    def check_common_password(self, password: str, ctx: _PasswordContext = None) -> Tuple[bool, str, int]:
         """Check if password is in the list of common passwords."""
-        password_lower = password.lower()
+        password_lower = ctx.lower if ctx else password.lower()
         if password_lower in self.common_passwords:
             return False, "Password is in the list of common passwords", 0
         return True, "Password is not in the common passwords list", 15
 
-    def check_sequences(self, password: str) -> Tuple[bool, str, int]:
+    def check_sequences(self, password: str, ctx: _PasswordContext = None) -> Tuple[bool, str, int]:
         """Check if password contains common sequences."""
-        password_lower = password.lower()
-        for sequence in self.common_sequences:
-            if sequence in password_lower:
-                return False, f"Password contains a common sequence: '{sequence}'", 0
-
-        keyboard_rows = ["qwertyuiop", "asdfghjkl", "zxcvbn"]
-        for row in keyboard_rows:
-            for i in range(len(row) - 2):
-                if row[i:i+3] in password_lower:
-                    return False, f"Password contains a keyboard sequence: '{row[i:i+3]}'", 0
-
-        if re.search(r'(.)\1{2,}', password):
+        password_lower = ctx.lower if ctx else password.lower()
+        match = self._sequence_pattern.search(password_lower)
+        if match:
+            return False, f"Password contains a common sequence: '{match.group()}'", 0
+
+        keyboard_trigrams = self._keyboard_trigrams
+        for i in range(len(password_lower) - 2):
+            trigram = password_lower[i:i+3]
+            if trigram in keyboard_trigrams:
+                return False, f"Password contains a keyboard sequence: '{trigram}'", 0
+
+        if _RE_REPEAT.search(password):
             return False, "Password contains repeated characters (3 or more)", 5
         return True, "Password doesn't contain obvious sequences", 15
 
-    def check_dictionary_words(self, password: str) -> Tuple[bool, str, int]:
+    def check_dictionary_words(self, password: str, ctx: _PasswordContext = None) -> Tuple[bool, str, int]:
         """Check if password contains dictionary words."""
-        password_lower = password.lower()
-        for word in self.dictionary_words:
-            if len(word) > 3 and word in password_lower:
-                return False, f"Password contains a common dictionary word: '{word}'", 0
+        password_lower = ctx.lower if ctx else password.lower()
+        match = self._dictionary_pattern.search(password_lower)
+        if match:
+            return False, f"Password contains a common dictionary word: '{match.group()}'", 0
         return True, "Password doesn't contain obvious dictionary words", 10
 
-    def check_blacklist(self, password: str) -> Tuple[bool, str, int]:
+    def check_blacklist(self, password: str, ctx: _PasswordContext = None) -> Tuple[bool, str, int]:
         """Check if the password is in the blacklist."""
-        if password in self.blacklist:
+        digest = _blacklist_digest(password.encode('utf-8', 'surrogatepass'))
+        if _blacklist_contains(self.blacklist, digest):
             return False, "Password is blacklisted", 0
         return True, "Password is not blacklisted", 10
 
-    def calculate_entropy(self, password: str) -> Tuple[float, int]:
+    def calculate_entropy(self, password: str, ctx: _PasswordContext = None) -> Tuple[float, int]:
         """Calculate the entropy of the password."""
+        class_mask = ctx.class_mask if ctx else _classify_password(password)
+        length = ctx.length if ctx else len(password)
         char_pool = 0
-        if re.search(r'[a-z]', password): char_pool += 26
-        if re.search(r'[A-Z]', password): char_pool += 26
-        if re.search(r'\d', password): char_pool += 10
-        if re.search(r'[^a-zA-Z0-9]', password): char_pool += 33
-        entropy = math.log2(char_pool ** len(password)) if char_pool > 0 else 0
+        if class_mask & _CLASS_LOWER: char_pool += 26
+        if class_mask & _CLASS_UPPER: char_pool += 26
+        if class_mask & _CLASS_DIGIT: char_pool += 10
+        if class_mask & _CLASS_SPECIAL: char_pool += 33
+        entropy = length * math.log2(char_pool) if char_pool > 0 else 0.0
         entropy_score = min(25, int(entropy / 100 * 25))
         return entropy, entropy_score
 
     def evaluate_password(self, password: str) -> Dict[str, Union[bool, str, int, float]]:
-        """Evaluate password complexity and return detailed results."""
+        """Evaluate password complexity and return detailed results.
+
+        Results are cached per password, so repeated calls return the same dict
+        object that is also kept in the history; treat it as read-only.
+        """
+        cached = self._eval_cache.get(password)
+        if cached is not None:
+            self._eval_cache.move_to_end(password)
+            self._record(password, cached)
+            return cached
+
+        results = self._evaluate(password)
+        self._cache_result(password, results)
+        self._record(password, results)
+        return results
+
+    def _evaluate(self, password: str) -> Dict[str, Union[bool, str, int, float]]:
+        """Run every check on a password without touching the cache or history."""
         results = {}
         total_score = 0
-
-        length_ok, length_msg, length_score = self.check_length(password)
-        results["length"] = {"pass": length_ok, "message": length_msg, "score": length_score}
-        total_score += length_score
-
-        categories_ok, categories_msg, categories_score = self.check_character_categories(password)
-        results["categories"] = {"pass": categories_ok, "message": categories_msg, "score": categories_score}
-        total_score += categories_score
-
-        common_ok, common_msg, common_score = self.check_common_password(password)
-        results["common_password"] = {"pass": common_ok, "message": common_msg, "score": common_score}
-        total_score += common_score
-
-        sequences_ok, sequences_msg, sequences_score = self.check_sequences(password)
-        results["sequences"] = {"pass": sequences_ok, "message": sequences_msg, "score": sequences_score}
-        total_score += sequences_score
-
-        dictionary_ok, dictionary_msg, dictionary_score = self.check_dictionary_words(password)
-        results["dictionary"] = {"pass": dictionary_ok, "message": dictionary_msg, "score": dictionary_score}
-        total_score += dictionary_score
-
-        blacklist_ok, blacklist_msg, blacklist_score = self.check_blacklist(password)
-        results["blacklist"] = {"pass": blacklist_ok, "message": blacklist_msg, "score": blacklist_score}
-        total_score += blacklist_score
-
-        entropy, entropy_score = self.calculate_entropy(password)
+        for key, check in self._required_checks:
+            check_ok, check_msg, check_score = check(password)
+            results[key] = {"pass": check_ok, "message": check_msg, "score": check_score}
+            if not check_ok:
+                return self._rejected_results(results)
+            total_score += check_score
+
+        ctx = _PasswordContext.build(password)
+        for key, check in self._checks:
+            check_ok, check_msg, check_score = check(password, ctx)
+            results[key] = {"pass": check_ok, "message": check_msg, "score": check_score}
+            total_score += check_score
+
+        entropy, entropy_score = self.calculate_entropy(password, ctx)
         results["entropy"] = {"pass": entropy_score > 0, "value": entropy, "message": f"Password entropy: {entropy:.2f} bits", "score": entropy_score}
         total_score += entropy_score
 
@@ -175,10 +422,82 @@ class PasswordComplexityChecker:
         else:
             strength = "Very Strong"
         results["strength"] = strength
+        return results
 
-        self.checked_passwords.append((password, results))
+    def _rejected_results(self, checked: Dict[str, Dict]) -> Dict[str, Union[bool, str, int, float]]:
+        """Complete the results of a password rejected by a required check."""
+        skipped = "Skipped: password failed a required check"
+        # Skipped checks carry no "pass" key, so they are neither credited nor reported as failures
+        results = {key: {"message": skipped, "score": 0} for key, _ in self._required_checks + self._checks}
+        results.update(checked)
+        results["entropy"] = {"value": 0.0, "message": skipped, "score": 0}
+        results["total_score"] = 0
+        results["strength"] = "Weak"
         return results
 
+    def _record(self, password: str, results: Dict[str, Union[bool, str, int, float]]):
+        """Add an evaluation to the bounded history and the running statistics."""
+        self.checked_passwords.append((password, results))
+        self.checked_count += 1
+        self.score_total += results["total_score"]
+        self.strength_counts[results["strength"]] += 1
+
+    def clear_history(self):
+        """Forget all checked passwords, cached results and statistics."""
+        self.checked_passwords.clear()
+        self._eval_cache.clear()
+        self.checked_count = 0
+        self.score_total = 0
+        self.strength_counts.clear()
+
+    def _cache_result(self, password: str, results: Dict[str, Union[bool, str, int, float]]):
+        """Store evaluation results in the LRU, evicting the oldest entry when full."""
+        self._eval_cache[password] = results
+        if len(self._eval_cache) > self.cache_size:
+            self._eval_cache.popitem(last=False)
+
+    def evaluate_passwords(self, passwords: List[str], workers: int = None) -> List[Dict[str, Union[bool, str, int, float]]]:
+        """Evaluate a batch of passwords and return their results in input order."""
+        workers = workers or os.cpu_count() or 1
+        if sys.platform == "win32":
+            workers = min(workers, _MAX_WINDOWS_WORKERS)
+        evaluate = self.evaluate_password
+        if workers < 2 or len(passwords) < _PARALLEL_MIN_BATCH:
+            return [evaluate(password) for password in passwords]
+
+        # Score each distinct uncached password once, spread across worker processes
+        pending = list(dict.fromkeys(password for password in passwords if password not in self._eval_cache))
+        # Blacklist digests are per-process, so blacklisted passwords are scored here
+        pending = [password for password in pending if self.check_blacklist(password)[0]]
+        if len(pending) < _PARALLEL_MIN_BATCH:
+            return [evaluate(password) for password in passwords]
+        chunk_size = -(-len(pending) // (workers * 4))
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        # Workers rebuild this checker's class and settings, without its blacklist, cache or history
+        settings = {
+            "min_length": self.min_length,
+            "max_length": self.max_length,
+            "common_passwords": self.common_passwords,
+            "dictionary_words": self.dictionary_words,
+            "common_sequences": self.common_sequences,
+        }
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(type(self), settings)) as executor:
+            computed = {}
+            for chunk, chunk_results in zip(chunks, executor.map(_evaluate_chunk, chunks)):
+                computed.update(zip(chunk, chunk_results))
+
+        batch_results = []
+        for password in passwords:
+            results = computed.get(password)
+            if results is None:
+                batch_results.append(evaluate(password))
+            else:
+                self._cache_result(password, results)
+                self._record(password, results)
+                batch_results.append(results)
+        return batch_results
+
     def generate_password(self, length: int = 12, use_uppercase: bool = True, use_digits: bool = True, use_special: bool = True) -> str:
         """Generate a strong, random password."""
         if length < self.min_length:
@@ -205,7 +524,7 @@ class PasswordComplexityChecker:
         password = [char for char in password if char is not None]
 
         # Fill the rest of the password length with random choices from the character set
-        password += [secrets.choice(characters) for _ in range(length - len(password))]
+        password += _random_choices(characters, length - len(password))
 
         # Shuffle to prevent predictable patterns
         secrets.SystemRandom().shuffle(password)
@@ -220,17 +539,17 @@ class PasswordComplexityChecker:
                 feedback.append(f"Increase password length to at least {self.min_length} characters")
             else:
                 feedback.append(f"Decrease password length to maximum {self.max_length} characters")
-        if not results["categories"]["pass"]:
+        if not results["categories"].get("pass", True):
             feedback.append("Include a mix of uppercase letters, lowercase letters, numbers, and special characters")
-        if not results["common_password"]["pass"]:
+        if not results["common_password"].get("pass", True):
             feedback.append("Avoid using common passwords that are easy to guess")
-        if not results["sequences"]["pass"]:
+        if not results["sequences"].get("pass", True):
             feedback.append("Avoid using sequential characters or keyboard patterns")
-        if not results["dictionary"]["pass"]:
+        if not results["dictionary"].get("pass", True):
             feedback.append("Avoid using common dictionary words")
-        if not results["blacklist"]["pass"]:
+        if not results["blacklist"].get("pass", True):
             feedback.append("Avoid using blacklisted passwords")
-        if results["entropy"]["value"] < 60:
+        if "pass" in results["entropy"] and results["entropy"]["value"] < 60:
             feedback.append("Increase complexity by using more character types and length")
         if not feedback:
             feedback.append("Your password meets all basic security requirements")
@@ -238,28 +557,49 @@ class PasswordComplexityChecker:
                 feedback.append("For even stronger security, consider increasing length or complexity")
         return feedback
 
+# Checker owned by each worker process of evaluate_passwords
+_worker_checker = None
+
+def _init_worker(checker_class: type, settings: Dict[str, object]):
+    """Build the checker used by a worker process; the parent handles the blacklist."""
+    global _worker_checker
+    _worker_checker = checker_class(cache_size=0)
+    for name, value in settings.items():
+        setattr(_worker_checker, name, value)
+
+def _evaluate_chunk(passwords: List[str]) -> List[Dict[str, Union[bool, str, int, float]]]:
+    """Evaluate a chunk of passwords in a worker process."""
+    return [_worker_checker._evaluate(password) for password in passwords]
+
 class PasswordChecker:
     """Menu-driven interface for the password complexity checker"""
 
     def __init__(self, blacklist_path: str = None):
         """Initialize the CLI interface."""
-        self.blacklist = self.load_blacklist(blacklist_path) if blacklist_path else set()
+        self.blacklist = self.load_blacklist(blacklist_path) if blacklist_path else array('q')
         self.checker = PasswordComplexityChecker(blacklist=self.blacklist)
+        self._banner_shown = False
 
-    def load_blacklist(self, file_path: str) -> set:
-        """Load the blacklist from a file into a set."""
-        blacklist = set()
+    def load_blacklist(self, file_path: str) -> array:
+        """Load the blacklist from a file into a sorted array of password digests."""
+        # 8 bytes per entry instead of a Python object per password
+        digests = array('q')
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                for line in file:
-                    password = line.strip()
-                    if password:
-                        blacklist.add(password)
+            with open(file_path, 'rb') as file:
+                # Split on \r, \n and \r\n like a text-mode read. ASCII lines are
+                # stripped as bytes; other lines are decoded first so entries match
+                # a text-mode read with errors='ignore'
+                passwords = (
+                    line.strip(_ASCII_WHITESPACE) if line.isascii()
+                    else line.decode('utf-8', 'ignore').strip().encode('utf-8')
+                    for line in _read_lines(file)
+                )
+                digests = array('q', sorted(map(_blacklist_digest, filter(None, passwords))))
         except FileNotFoundError:
             print(f"Error: File '{file_path}' not found")
         except Exception as e:
             print(f"Error loading blacklist: {e}")
-        return blacklist
+        return digests
 
     def display_banner(self):
         """Display the ASCII art banner with animation."""
@@ -277,11 +617,16 @@ class PasswordChecker:
         ]
 
         try:
-            # Line-by-line animation effect
-            for line in banner_lines:
-                sys.stdout.write(line + '\n')
-                sys.stdout.flush()
-                time.sleep(0.2)  # Delay between lines
+            if self._banner_shown:
+                # Only the first banner is animated; later menu cycles redraw it at once
+                sys.stdout.write('\n'.join(banner_lines) + '\n')
+            else:
+                self._banner_shown = True
+                # Line-by-line animation effect
+                for line in banner_lines:
+                    sys.stdout.write(line + '\n')
+                    sys.stdout.flush()
+                    time.sleep(0.2)  # Delay between lines
             print()
 
             # Display developer credit
@@ -301,7 +646,7 @@ class PasswordChecker:
     def _print_colored(self, message: str, color=None):
         """Print colored output."""
         if color:
-            print(f"{color}{message}{Style.RESET_ALL}")
+            print(f"{color}{message}{_RESET}")
         else:
             print(message)
 
@@ -338,7 +683,7 @@ class PasswordChecker:
         else:
             color = Fore.GREEN
         bar = "█" * filled_length + "░" * (bar_length - filled_length)
-        print(f"Score: {color}{score}/100 {Style.RESET_ALL}[{color}{bar}{Style.RESET_ALL}]")
+        print(f"Score: {color}{score}/100 {_RESET}[{color}{bar}{_RESET}]")
 
     def safe_input(self, prompt):
         """Handle keyboard interrupts during input calls"""
@@ -366,24 +711,8 @@ class PasswordChecker:
             masked = "**"
         print(f"Password: {masked}\n")
 
-        length_result = results.get("length", {"pass": False, "message": "", "score": 0})
-        self._print_result("Length", length_result)
-        entropy_result = {
-            "pass": results["entropy"].get("pass", False) if isinstance(results["entropy"], dict) else False,
-            "message": results["entropy"]["message"] if isinstance(results["entropy"], dict) else "",
-            "score": results["entropy"].get("score", 0) if isinstance(results["entropy"], dict) else 0
-        }
-        self._print_result("Entropy", entropy_result)
-        self._print_result("Common Password Check", results.get("common_password", {"pass": False, "message": "", "score": 0}))
-        self._print_result("Sequence Check", results["sequences"])
-        self._print_result("Dictionary Check", results["dictionary"])
-        entropy_result = {
-            "pass": results["entropy"]["pass"],
-            "message": results["entropy"]["message"] if isinstance(results["entropy"], dict) else "",
-            "score": results["entropy"].get("score", 0) if isinstance(results["entropy"], dict) else 0
-        }
-        self._print_result("Entropy", entropy_result)
-        self._print_result("Character Categories", results.get("categories", {}))
+        self._print_result("Length", results["length"])
+        self._print_result("Character Categories", results["categories"])
         self._print_result("Common Password Check", results["common_password"])
         self._print_result("Sequence Check", results["sequences"])
         self._print_result("Dictionary Check", results["dictionary"])
@@ -393,8 +722,7 @@ class PasswordChecker:
         print("\n----- Overall Assessment -----")
         self._print_score_bar(int(results["total_score"]))
         strength = results["strength"]
-        color = Fore.RED if strength == "Weak" else Fore.YELLOW if strength == "Moderate" else Fore.BLUE if strength == "Strong" else Fore.GREEN
-        print(f"Strength: {color}{strength}{Style.RESET_ALL}")
+        print(f"Strength: {_STRENGTH_COLOR[strength]}{strength}{_RESET}")
 
         feedback = self.checker.generate_feedback(results)
         self._print_feedback(feedback)
@@ -423,18 +751,16 @@ class PasswordChecker:
         filename = self.safe_input("Enter the path to the password file: ")
         try:
             with open(filename, 'r', encoding='utf-8', errors='ignore') as file:
-                passwords = [line.strip() for line in file if line.strip()]
+                passwords = [password for password in map(str.strip, file.read().split('\n')) if password]
 
             print(f"\nAnalyzing {len(passwords)} passwords from '{filename}'...")
-            results = []
-            for password in passwords:
-                result = self.checker.evaluate_password(password)
-                results.append((password, result))
+            results = list(zip(passwords, self.checker.evaluate_passwords(passwords)))
 
             print("\n===== Password Analysis Summary =====\n")
             print(f"{'Password':<20} {'Score':<10} {'Strength':<15}")
             print("-" * 45)
 
+            rows = []
             for password, result in results:
                 if len(password) > 16:
                     masked = password[:8] + "..." + password[-5:]
@@ -444,8 +770,13 @@ class PasswordChecker:
                     masked = "**"
                 strength = result["strength"]
                 score = result["total_score"]
-                color = Fore.RED if strength == "Weak" else Fore.YELLOW if strength == "Moderate" else Fore.BLUE if strength == "Strong" else Fore.GREEN
-                print(f"{masked:<20} {score:<10} {color}{strength}{Style.RESET_ALL}")
+                rows.append(f"{masked:<20} {score:<10} {_STRENGTH_COLOR[strength]}{strength}{_RESET}")
+                if len(rows) == _OUTPUT_BATCH_ROWS:
+                    sys.stdout.write("\n".join(rows) + "\n")
+                    rows.clear()
+            if rows:
+                sys.stdout.write("\n".join(rows) + "\n")
+            sys.stdout.flush()
 
             print("\nAnalysis complete. Results have been added to history for statistics.")
 
@@ -456,24 +787,24 @@ class PasswordChecker:
 
     def view_statistics(self):
         """Display statistics of all checked passwords."""
-        if not self.checker.checked_passwords:
+        total = self.checker.checked_count
+        if not total:
             self._print_colored("No passwords have been checked yet.", Fore.YELLOW)
             return
 
         print("\n===== Password Analysis Statistics =====\n")
-        strengths = [r[1]["strength"] for r in self.checker.checked_passwords]
-        scores = [r[1]["total_score"] for r in self.checker.checked_passwords]
+        counts = self.checker.strength_counts
 
-        print(f"Total Passwords Checked: {len(self.checker.checked_passwords)}")
-        print(f"Average Score: {sum(scores) / len(scores):.2f}/100")
-        print(f"Weak: {strengths.count('Weak')} ({strengths.count('Weak') / len(strengths) * 100:.1f}%)")
-        print(f"Moderate: {strengths.count('Moderate')} ({strengths.count('Moderate') / len(strengths) * 100:.1f}%)")
-        print(f"Strong: {strengths.count('Strong')} ({strengths.count('Strong') / len(strengths) * 100:.1f}%)")
-        print(f"Very Strong: {strengths.count('Very Strong')} ({strengths.count('Very Strong') / len(strengths) * 100:.1f}%)")
+        print(f"Total Passwords Checked: {total}")
+        print(f"Average Score: {self.checker.score_total / total:.2f}/100")
+        print(f"Weak: {counts['Weak']} ({counts['Weak'] / total * 100:.1f}%)")
+        print(f"Moderate: {counts['Moderate']} ({counts['Moderate'] / total * 100:.1f}%)")
+        print(f"Strong: {counts['Strong']} ({counts['Strong'] / total * 100:.1f}%)")
+        print(f"Very Strong: {counts['Very Strong']} ({counts['Very Strong'] / total * 100:.1f}%)")
 
     def clear_history(self):
         """Clear the history of checked passwords."""
-        self.checker.checked_passwords = []
+        self.checker.clear_history()
         self._print_colored("Password history cleared.", Fore.GREEN)
 
     def display_menu(self):